@@ -124,6 +124,15 @@ def main():
                         st.session_state.chat_history = []
                         
                         st.success(f"✅ Processed {len(documents)} document(s) successfully!")
+                        
+                        stats = st.session_state.rag_engine.chunk_stats
+                        if stats:
+                            st.info(
+                                f"**Chunks:** {stats['chunks']} · "
+                                f"**Tokens:** {stats['total_tokens']} "
+                                f"(min {stats['min_tokens']}, mean {stats['mean_tokens']}, "
+                                f"max {stats['max_tokens']})"
+                            )
                         logger.info(f"Successfully processed {len(documents)} documents")
                         
                     except Exception as e:
@@ -21,7 +21,8 @@ class Config:
     
     # Paths
     BASE_DIR: Path = Path(__file__).parent.parent
-    LOGS_DIR: Path = BASE_DIR / "logs"
+    LOGS_DIR: Path = Path(os.getenv("LOGS_DIR", BASE_DIR / "logs"))
+    INGEST_DIR: Path = Path(os.getenv("INGEST_DIR", BASE_DIR / "data" / "ingest"))
     
     # LLM Configuration
     MODEL_NAME: str = os.getenv("MODEL_NAME", "gpt-3.5-turbo")
@@ -31,6 +32,11 @@ class Config:
     # Vector Store Configuration
     CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "1000"))
     CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "200"))
+    CHUNK_LENGTH_UNIT: str = os.getenv("CHUNK_LENGTH_UNIT", "characters").lower()
+    TOKENIZER_ENCODING: str = os.getenv("TOKENIZER_ENCODING", "cl100k_base")
+    TOKENIZER_THREADS: int = int(os.getenv("TOKENIZER_THREADS", "8"))
+    INGEST_BATCH_SIZE: int = int(os.getenv("INGEST_BATCH_SIZE", "100"))
+    INGEST_KEEP: int = int(os.getenv("INGEST_KEEP", "1"))
     
     # Streamlit Configuration
     STREAMLIT_SERVER_PORT: int = int(os.getenv("STREAMLIT_SERVER_PORT", "8501"))
@@ -44,8 +50,25 @@ class Config:
                 "OPENAI_API_KEY is not set. Please set it in .env file or environment variables."
             )
         
+        if cls.CHUNK_LENGTH_UNIT not in ("characters", "tokens"):
+            raise ValueError(
+                "CHUNK_LENGTH_UNIT must be 'characters' or 'tokens'."
+            )
+        
+        if cls.TOKENIZER_THREADS < 1:
+            raise ValueError("TOKENIZER_THREADS must be at least 1.")
+        
+        if not 0 <= cls.CHUNK_OVERLAP < cls.CHUNK_SIZE:
+            raise ValueError(
+                "CHUNK_OVERLAP must be non-negative and smaller than CHUNK_SIZE."
+            )
+        
+        if cls.INGEST_KEEP < 1:
+            raise ValueError("INGEST_KEEP must be at least 1.")
+        
         # Create necessary directories
-        cls.LOGS_DIR.mkdir(exist_ok=True)
+        cls.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        cls.INGEST_DIR.mkdir(parents=True, exist_ok=True)
 
 
 # Validate configuration on import
@@ -0,0 +1,240 @@
+"""Durable checkpoint journal for resumable document ingestion."""
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from langchain_core.documents import Document
+
+from src.config import Config
+from src.logger import Logger
+
+
+logger = Logger.get_logger("ingest_journal")
+
+
+def file_hash(file_path: str) -> str:
+    """
+    Compute a content hash of a file.
+
+    Uploaded files are written to random temp paths, so the file bytes
+    rather than the path identify the source across ingest attempts.
+
+    Args:
+        file_path: Path of the file to hash
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def tag_source(documents: List[Document], file_path: str) -> List[Document]:
+    """
+    Record the content hash of the source file on loaded documents.
+
+    Args:
+        documents: Documents loaded from file_path
+        file_path: Path the documents were loaded from
+
+    Returns:
+        The same documents, with ``source_hash`` set in their metadata
+    """
+    digest = file_hash(file_path)
+    for document in documents:
+        document.metadata["source_hash"] = digest
+    return documents
+
+
+def chunk_id(chunk: Document) -> str:
+    """
+    Compute a deterministic ID for a chunk.
+
+    Args:
+        chunk: Document chunk
+
+    Returns:
+        Hex digest of the chunk source hash (or source), page and content
+    """
+    source = chunk.metadata.get("source_hash") or chunk.metadata.get("source", "")
+    digest = hashlib.sha256()
+    digest.update(str(source).encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(str(chunk.metadata.get("page", "")).encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(chunk.page_content.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def dedupe_chunks(chunks: List[Document]) -> Tuple[List[str], List[Document]]:
+    """
+    Assign chunk IDs and drop duplicate chunks.
+
+    Args:
+        chunks: Document chunks
+
+    Returns:
+        Tuple of unique chunk IDs and the matching chunks, in input order
+    """
+    unique_chunks = {}
+    for chunk in chunks:
+        unique_chunks.setdefault(chunk_id(chunk), chunk)
+    return list(unique_chunks), list(unique_chunks.values())
+
+
+def ingest_id(chunk_ids: List[str]) -> str:
+    """
+    Compute the ID of an ingest from its chunk IDs.
+
+    Args:
+        chunk_ids: Unique chunk IDs of the corpus
+
+    Returns:
+        Hex digest identifying the corpus
+    """
+    return hashlib.sha256("\n".join(chunk_ids).encode("utf-8")).hexdigest()
+
+
+def _last_used(path: Path) -> float:
+    """Return the mtime of an ingest directory, or 0 if it has vanished."""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def prune_ingests(keep: int) -> List[str]:
+    """
+    Delete all but the ``keep`` most recently used ingest directories.
+
+    Directories held by a live engine in this process (see
+    ``IngestJournal.acquire``) are never deleted and count towards ``keep``.
+
+    Args:
+        keep: Number of ingest directories to retain
+
+    Returns:
+        Ingest IDs that were deleted
+    """
+    removed = []
+    with IngestJournal._lock:
+        in_use = set(IngestJournal._in_use)
+        directories = sorted(
+            (
+                path for path in Config.INGEST_DIR.iterdir()
+                if path.is_dir() and path.name not in in_use
+            ),
+            key=_last_used,
+            reverse=True,
+        )
+        for path in directories[max(0, keep - len(in_use)):]:
+            shutil.rmtree(path, ignore_errors=True)
+            removed.append(path.name)
+
+    if removed:
+        logger.info(f"Pruned {len(removed)} old ingest directories")
+    return removed
+
+
+class IngestJournal:
+    """Append-only journal of chunk IDs already written to the vector store."""
+
+    # Ingest IDs held by live engines in this process, with holder counts
+    _in_use: Dict[str, int] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, ingest_id: str):
+        """
+        Open (or create) the journal for an ingest.
+
+        Args:
+            ingest_id: Deterministic ID of the corpus being ingested
+        """
+        self.ingest_id = ingest_id
+        self.directory: Path = Config.INGEST_DIR / ingest_id
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Mark as most recently used for prune_ingests
+        os.utime(self.directory)
+        self.path: Path = self.directory / "journal.jsonl"
+        self.completed: Set[str] = self._load()
+
+        if self.completed:
+            logger.info(
+                f"Resuming ingest {ingest_id[:12]} with "
+                f"{len(self.completed)} indexed chunks"
+            )
+
+    @property
+    def persist_directory(self) -> str:
+        """Directory holding the Chroma collection for this ingest."""
+        return str(self.directory / "chroma")
+
+    def _load(self) -> Set[str]:
+        """Read committed chunk IDs, ignoring a torn trailing line."""
+        completed: Set[str] = set()
+        if not self.path.exists():
+            return completed
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    completed.update(json.loads(line)["chunk_ids"])
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Skipping corrupt journal entry in {self.path}")
+
+        return completed
+
+    def acquire(self) -> None:
+        """Mark this ingest as in use so prune_ingests will not delete it."""
+        with self._lock:
+            self._in_use[self.ingest_id] = self._in_use.get(self.ingest_id, 0) + 1
+
+    def release(self, delete: bool = False) -> bool:
+        """
+        Drop one in-use hold on this ingest.
+
+        Args:
+            delete: Delete the ingest directory if no other engine holds it
+
+        Returns:
+            True if the ingest directory was deleted
+        """
+        with self._lock:
+            holders = self._in_use.get(self.ingest_id, 0) - 1
+            if holders > 0:
+                self._in_use[self.ingest_id] = holders
+                return False
+
+            self._in_use.pop(self.ingest_id, None)
+            if delete:
+                self.delete()
+            return delete
+
+    def is_complete(self, chunk: str) -> bool:
+        """Return True if the chunk has already been committed."""
+        return chunk in self.completed
+
+    def record(self, chunk_ids: List[str]) -> None:
+        """
+        Durably record a committed batch of chunks.
+
+        Args:
+            chunk_ids: IDs of the chunks written to the vector store
+        """
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"chunk_ids": chunk_ids}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed.update(chunk_ids)
+
+    def delete(self) -> None:
+        """Delete the journal and the vector store persisted for this ingest."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.completed = set()
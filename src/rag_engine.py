@@ -1,8 +1,7 @@
 """RAG Engine implementation using LangChain and Chroma."""
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from langchain_classic.chains import RetrievalQA
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.document_loaders import (
     PyPDFLoader,
     TextLoader,
@@ -14,12 +13,21 @@ try:
     DOCX_SUPPORT = True
 except ImportError:
     DOCX_SUPPORT = False
+from chromadb.api.client import SharedSystemClient
 from langchain_community.vectorstores import Chroma
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.documents import Document
 
 from src.config import Config
+from src.ingest_journal import (
+    IngestJournal,
+    dedupe_chunks,
+    ingest_id,
+    prune_ingests,
+    tag_source,
+)
 from src.logger import Logger
+from src.tokenizer import build_text_splitter, token_stats
 
 
 logger = Logger.get_logger("rag_engine")
@@ -47,14 +55,13 @@ class RAGEngine:
             api_key=Config.OPENAI_API_KEY
         )
         
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=Config.CHUNK_SIZE,
-            chunk_overlap=Config.CHUNK_OVERLAP,
-            length_function=len,
-        )
+        # CHUNK_SIZE/CHUNK_OVERLAP are measured in CHUNK_LENGTH_UNIT
+        self.text_splitter = build_text_splitter()
         
         self.vector_store: Optional[Chroma] = None
+        self.ingest_journal: Optional[IngestJournal] = None
         self.qa_chain: Optional[RetrievalQA] = None
+        self.chunk_stats: Optional[Dict[str, float]] = None
         
         logger.info("RAG Engine initialized successfully")
     
@@ -87,7 +94,7 @@ class RAGEngine:
                     logger.warning(f"Unsupported file type: {file_path}")
                     continue
                 
-                docs = loader.load()
+                docs = tag_source(loader.load(), file_path)
                 documents.extend(docs)
                 logger.info(f"Loaded {len(docs)} pages from {file_path}")
                 
@@ -116,6 +123,15 @@ class RAGEngine:
         """
         Create vector store from documents.
         
+        Chunks are embedded in batches of ``Config.INGEST_BATCH_SIZE`` and the
+        IDs of each committed batch are recorded in an ingest journal, so
+        re-running an interrupted ingest of the same documents only embeds the
+        chunks not yet indexed. Chunk IDs are content-derived, so retried
+        batches upsert rather than duplicate vectors. Ingest directories are
+        kept after a failure for resume; once an ingest succeeds, all but the
+        ``Config.INGEST_KEEP`` most recent are deleted, except ingests held
+        by a live engine in this process.
+        
         Args:
             documents: List of documents to index
         """
@@ -126,28 +142,90 @@ class RAGEngine:
             chunks = self.text_splitter.split_documents(documents)
             logger.info(f"Split documents into {len(chunks)} chunks")
             
-            # Create in-memory Chroma vector store
-            self.vector_store = Chroma.from_documents(
-                documents=chunks,
-                embedding=self.embeddings,
-                collection_name="rag_collection",
-            )
+            # Drop duplicate chunks so every ID in the collection is unique
+            ids, chunks = dedupe_chunks(chunks)
             
-            # Create QA chain
-            self.qa_chain = RetrievalQA.from_chain_type(
-                llm=self.llm,
-                chain_type="stuff",
-                retriever=self.vector_store.as_retriever(
-                    search_kwargs={"k": 3}
-                ),
-                return_source_documents=True,
-            )
+            journal = IngestJournal(ingest_id(ids))
+            # Hold the ingest while indexing so other sessions cannot prune it
+            journal.acquire()
+            try:
+                # Persistent Chroma vector store scoped to this ingest
+                vector_store = Chroma(
+                    collection_name="rag_collection",
+                    embedding_function=self.embeddings,
+                    persist_directory=journal.persist_directory,
+                )
+                
+                # Only embed chunks not yet committed, so resume does not depend
+                # on INGEST_BATCH_SIZE staying the same between attempts
+                pending = [i for i, chunk in enumerate(ids) if not journal.is_complete(chunk)]
+                if len(pending) < len(ids):
+                    logger.info(f"Skipping {len(ids) - len(pending)} already indexed chunks")
+                
+                batch_size = max(1, Config.INGEST_BATCH_SIZE)
+                for start in range(0, len(pending), batch_size):
+                    batch = pending[start:start + batch_size]
+                    batch_ids = [ids[i] for i in batch]
+                
+                    vector_store.add_documents(
+                        [chunks[i] for i in batch],
+                        ids=batch_ids,
+                    )
+                    journal.record(batch_ids)
+                    logger.info(
+                        f"Indexed {min(start + batch_size, len(pending))}/{len(pending)} pending chunks"
+                    )
+                
+                # Create QA chain
+                qa_chain = RetrievalQA.from_chain_type(
+                    llm=self.llm,
+                    chain_type="stuff",
+                    retriever=vector_store.as_retriever(
+                        search_kwargs={"k": 3}
+                    ),
+                    return_source_documents=True,
+                )
+            except Exception:
+                journal.release()
+                raise
+            
+            # Switch to the new store only once it is fully indexed
+            if self.ingest_journal:
+                self.ingest_journal.release()
+            self.ingest_journal = journal
+            self.vector_store = vector_store
+            self.qa_chain = qa_chain
             
             logger.info("Vector store and QA chain created successfully")
             
         except Exception as e:
             logger.error(f"Error creating vector store: {str(e)}")
             raise
+        
+        # The store is committed; housekeeping failures are logged only so the
+        # ingest is not reported as failed
+        try:
+            # Keep failed ingests for resume; prune once one succeeds
+            if prune_ingests(Config.INGEST_KEEP):
+                # Process-wide: drops cached Chroma clients for every session
+                # so deleted directories are not reused; clients already held
+                # by live vector stores keep working
+                SharedSystemClient.clear_system_cache()
+        except Exception as e:
+            logger.error(f"Error pruning ingest directories: {str(e)}")
+        
+        try:
+            self.chunk_stats = token_stats([chunk.page_content for chunk in chunks])
+            logger.info(
+                f"Chunk token stats: {self.chunk_stats['chunks']} chunks, "
+                f"{self.chunk_stats['total_tokens']} total tokens, "
+                f"min {self.chunk_stats['min_tokens']}, "
+                f"mean {self.chunk_stats['mean_tokens']}, "
+                f"max {self.chunk_stats['max_tokens']}"
+            )
+        except Exception as e:
+            self.chunk_stats = None
+            logger.error(f"Error computing chunk token stats: {str(e)}")
     
     def query(self, question: str) -> dict:
         """
@@ -186,10 +264,22 @@ class RAGEngine:
             logger.error(f"Error processing query: {str(e)}")
             raise
     
+    def __del__(self):
+        """Release the ingest held by this engine when its session ends."""
+        if getattr(self, "ingest_journal", None):
+            self.ingest_journal.release()
+    
     def reset(self) -> None:
         """Reset the RAG engine."""
         logger.info("Resetting RAG Engine")
+        # Another session may be using the same corpus; only delete if not
+        if self.ingest_journal and self.ingest_journal.release(delete=True):
+            # Process-wide: drops cached Chroma clients for every session;
+            # clients already held by live vector stores keep working
+            SharedSystemClient.clear_system_cache()
+        self.ingest_journal = None
         self.vector_store = None
         self.qa_chain = None
+        self.chunk_stats = None
         logger.info("RAG Engine reset successfully")
 
@@ -0,0 +1,83 @@
+"""Shared tiktoken encoder and token counting helpers."""
+from functools import lru_cache
+from typing import Dict, List
+
+import tiktoken
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from src.config import Config
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str) -> tiktoken.Encoding:
+    """
+    Get a shared tiktoken encoding, loading it once per process.
+
+    Args:
+        name: Encoding name
+
+    Returns:
+        Cached encoding instance
+    """
+    return tiktoken.get_encoding(name)
+
+
+def build_text_splitter() -> RecursiveCharacterTextSplitter:
+    """
+    Build the document splitter for the configured CHUNK_LENGTH_UNIT.
+
+    Returns:
+        Splitter measuring CHUNK_SIZE/CHUNK_OVERLAP in characters or in
+        TOKENIZER_ENCODING tokens
+    """
+    length_function = len
+    if Config.CHUNK_LENGTH_UNIT == "tokens":
+        encoding = get_encoding(Config.TOKENIZER_ENCODING)
+
+        # Special-token text in documents is counted as ordinary text
+        def length_function(text: str) -> int:
+            return len(encoding.encode_ordinary(text))
+
+    return RecursiveCharacterTextSplitter(
+        chunk_size=Config.CHUNK_SIZE,
+        chunk_overlap=Config.CHUNK_OVERLAP,
+        length_function=length_function,
+    )
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """
+    Count tokens for many texts using tiktoken's threaded batch encoder.
+
+    Args:
+        texts: Texts to count
+
+    Returns:
+        Number of tokens per text, in input order
+    """
+    encoded = get_encoding(Config.TOKENIZER_ENCODING).encode_ordinary_batch(
+        texts,
+        num_threads=Config.TOKENIZER_THREADS,
+    )
+    return [len(tokens) for tokens in encoded]
+
+
+def token_stats(texts: List[str]) -> Dict[str, float]:
+    """
+    Summarize token counts for a list of texts.
+
+    Args:
+        texts: Texts to summarize
+
+    Returns:
+        Dictionary with chunk count and total/min/max/mean tokens
+    """
+    counts = count_tokens_batch(texts) if texts else []
+    total = sum(counts)
+    return {
+        "chunks": len(counts),
+        "total_tokens": total,
+        "min_tokens": min(counts, default=0),
+        "max_tokens": max(counts, default=0),
+        "mean_tokens": round(total / len(counts), 1) if counts else 0.0,
+    }
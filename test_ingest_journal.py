@@ -0,0 +1,169 @@
+"""Offline tests for the ingest journal."""
+import os
+import sys
+import tempfile
+
+# Config validates on import; these tests never call the API
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+# Keep logs and ingest checkpoints out of the working tree
+_TEST_DIR = tempfile.mkdtemp(prefix="rag-test-")
+os.environ["LOGS_DIR"] = os.path.join(_TEST_DIR, "logs")
+os.environ["INGEST_DIR"] = os.path.join(_TEST_DIR, "ingest")
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from langchain_core.documents import Document
+
+from src.config import Config
+from src.ingest_journal import (
+    IngestJournal,
+    chunk_id,
+    dedupe_chunks,
+    ingest_id,
+    prune_ingests,
+    tag_source,
+)
+
+
+def _write_temp(data: bytes, suffix: str = ".txt") -> str:
+    """Write bytes to a new temp file, as app.save_uploaded_files does."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+        tmp_file.write(data)
+        return tmp_file.name
+
+
+def test_same_upload_at_different_temp_paths_has_same_ingest_id():
+    """Re-uploading the same bytes must resume the same ingest."""
+    data = b"Compliance policy section 1.\nCompliance policy section 2.\n"
+    paths = [_write_temp(data), _write_temp(data)]
+    assert paths[0] != paths[1]
+
+    try:
+        ids = []
+        for path in paths:
+            documents = tag_source(
+                [Document(page_content=data.decode(), metadata={"source": path, "page": 0})],
+                path,
+            )
+            chunk_ids, _ = dedupe_chunks(documents)
+            ids.append(ingest_id(chunk_ids))
+    finally:
+        for path in paths:
+            os.unlink(path)
+
+    assert ids[0] == ids[1]
+
+
+def test_chunk_id_is_deterministic_and_dedupes():
+    """Identical chunks share an ID and are indexed once."""
+    first = Document(page_content="alpha", metadata={"source": "a.txt", "page": 0})
+    same = Document(page_content="alpha", metadata={"source": "a.txt", "page": 0})
+    other_page = Document(page_content="alpha", metadata={"source": "a.txt", "page": 1})
+    other_text = Document(page_content="beta", metadata={"source": "a.txt", "page": 0})
+
+    assert chunk_id(first) == chunk_id(same)
+    assert chunk_id(first) != chunk_id(other_page)
+    assert chunk_id(first) != chunk_id(other_text)
+
+    ids, chunks = dedupe_chunks([first, other_text, same, other_page])
+    assert ids == [chunk_id(first), chunk_id(other_text), chunk_id(other_page)]
+    assert chunks == [first, other_text, other_page]
+
+
+def test_journal_record_round_trip(tmp_path, monkeypatch):
+    """Recorded chunk IDs are complete after reopening the journal."""
+    monkeypatch.setattr(Config, "INGEST_DIR", tmp_path)
+
+    journal = IngestJournal("corpus")
+    assert not journal.is_complete("c1")
+    journal.record(["c1", "c2"])
+    assert journal.is_complete("c1")
+
+    reopened = IngestJournal("corpus")
+    assert reopened.is_complete("c1")
+    assert reopened.is_complete("c2")
+    assert not reopened.is_complete("c3")
+
+
+def test_journal_ignores_torn_trailing_line(tmp_path, monkeypatch):
+    """A partially written last entry does not block resume."""
+    monkeypatch.setattr(Config, "INGEST_DIR", tmp_path)
+
+    journal = IngestJournal("corpus")
+    journal.record(["c1"])
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"chunk_ids": ["c2", "c')
+
+    reopened = IngestJournal("corpus")
+    assert reopened.completed == {"c1"}
+
+
+def test_prune_ingests_keeps_in_use_and_most_recent(tmp_path, monkeypatch):
+    """Pruning never deletes held ingests and keeps the newest others."""
+    monkeypatch.setattr(Config, "INGEST_DIR", tmp_path)
+
+    current = IngestJournal("current")
+    current.acquire()
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        path = tmp_path / name
+        path.mkdir()
+        mtime = 1_000_000 - age * 100
+        os.utime(path, (mtime, mtime))
+
+    try:
+        removed = prune_ingests(keep=2)
+    finally:
+        current.release()
+
+    assert sorted(removed) == ["middle", "oldest"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["current", "newest"]
+
+
+def test_prune_ingests_never_deletes_other_sessions_ingests(tmp_path, monkeypatch):
+    """Ingests held by other live engines survive even with keep=1."""
+    monkeypatch.setattr(Config, "INGEST_DIR", tmp_path)
+
+    mine = IngestJournal("mine")
+    theirs = IngestJournal("theirs")
+    mine.acquire()
+    theirs.acquire()
+    (tmp_path / "stale").mkdir()
+
+    try:
+        removed = prune_ingests(keep=1)
+    finally:
+        mine.release()
+        theirs.release()
+
+    assert removed == ["stale"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["mine", "theirs"]
+
+
+def test_journal_delete_removes_directory(tmp_path, monkeypatch):
+    """Deleting a journal removes its checkpoint directory."""
+    monkeypatch.setattr(Config, "INGEST_DIR", tmp_path)
+
+    journal = IngestJournal("corpus")
+    journal.record(["c1"])
+    journal.delete()
+
+    assert not journal.directory.exists()
+    assert not journal.is_complete("c1")
+
+
+def test_release_with_delete_keeps_shared_ingest(tmp_path, monkeypatch):
+    """Reset in one session does not delete an ingest another session holds."""
+    monkeypatch.setattr(Config, "INGEST_DIR", tmp_path)
+
+    first = IngestJournal("shared")
+    second = IngestJournal("shared")
+    first.acquire()
+    second.acquire()
+
+    assert not first.release(delete=True)
+    assert second.directory.exists()
+
+    assert second.release(delete=True)
+    assert not second.directory.exists()
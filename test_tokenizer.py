@@ -0,0 +1,104 @@
+"""Offline tests for token-aware chunking."""
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Config validates on import; these tests never call the API
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+# Keep logs and ingest checkpoints out of the working tree
+_TEST_DIR = tempfile.mkdtemp(prefix="rag-test-")
+os.environ["LOGS_DIR"] = os.path.join(_TEST_DIR, "logs")
+os.environ["INGEST_DIR"] = os.path.join(_TEST_DIR, "ingest")
+
+# Add src to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import tiktoken
+
+from src import tokenizer
+from src.config import Config
+from src.tokenizer import build_text_splitter, token_stats
+
+# cl100k_base pre-tokenization pattern, used by the offline fallback encoding
+CL100K_PATTERN = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}+|\p{N}{1,3}|"""
+    r""" ?[^\s\p{L}\p{N}]++[\r\n]*|\s*[\r\n]|\s+(?!\S)|\s+"""
+)
+
+
+@pytest.fixture
+def encoding(monkeypatch):
+    """
+    Use the cached tiktoken encoding, or a byte-level stand-in when the
+    encoding file cannot be downloaded.
+    """
+    tokenizer.get_encoding.cache_clear()
+    try:
+        enc = tiktoken.get_encoding(Config.TOKENIZER_ENCODING)
+    except Exception:
+        enc = tiktoken.Encoding(
+            "offline",
+            pat_str=CL100K_PATTERN,
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={"<|endoftext|>": 256},
+        )
+        monkeypatch.setattr(tiktoken, "get_encoding", lambda name: enc)
+    yield enc
+    tokenizer.get_encoding.cache_clear()
+
+
+def test_token_stats_empty():
+    """No chunks report zeros instead of failing."""
+    assert token_stats([]) == {
+        "chunks": 0,
+        "total_tokens": 0,
+        "min_tokens": 0,
+        "max_tokens": 0,
+        "mean_tokens": 0.0,
+    }
+
+
+def test_token_stats_min_mean_max(encoding):
+    """Stats match per-text token counts."""
+    texts = ["one", "one two three", "one two three four five six"]
+    counts = [len(encoding.encode_ordinary(text)) for text in texts]
+
+    stats = token_stats(texts)
+
+    assert stats["chunks"] == 3
+    assert stats["total_tokens"] == sum(counts)
+    assert stats["min_tokens"] == min(counts)
+    assert stats["max_tokens"] == max(counts)
+    assert stats["mean_tokens"] == round(sum(counts) / 3, 1)
+
+
+def test_token_mode_chunks_fit_chunk_size(encoding, monkeypatch):
+    """Token-mode chunks never exceed CHUNK_SIZE tokens."""
+    monkeypatch.setattr(Config, "CHUNK_LENGTH_UNIT", "tokens")
+    monkeypatch.setattr(Config, "CHUNK_SIZE", 40)
+    monkeypatch.setattr(Config, "CHUNK_OVERLAP", 8)
+
+    paragraph = (
+        "Records must be retained for seven years. Access requires approval "
+        "from the data owner. <|endoftext|> Exceptions are logged and reviewed."
+    )
+    text = "\n\n".join(paragraph for _ in range(20))
+
+    chunks = build_text_splitter().split_text(text)
+
+    assert len(chunks) > 1
+    assert max(len(encoding.encode_ordinary(chunk)) for chunk in chunks) <= 40
+
+
+def test_character_mode_uses_len(monkeypatch):
+    """Character mode keeps measuring CHUNK_SIZE in characters."""
+    monkeypatch.setattr(Config, "CHUNK_LENGTH_UNIT", "characters")
+    monkeypatch.setattr(Config, "CHUNK_SIZE", 50)
+    monkeypatch.setattr(Config, "CHUNK_OVERLAP", 10)
+
+    chunks = build_text_splitter().split_text("word " * 100)
+
+    assert max(len(chunk) for chunk in chunks) <= 50